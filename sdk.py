@@ -1,16 +1,83 @@
 """
-Coinone SDK (同步版)
+Coinone SDK (同步版 CoinoneClient / 异步版 CoinoneAsyncClient)
 支持常用 Public V2 接口 和 Private V2.1 签名接口
-依赖: requests
-pip install requests
+依赖: requests (可选 httpx 作为默认传输层，可选 orjson 加速 JSON 序列化与解析，可选 ijson 流式解析行情，
+      可选 msgpack 作为磁盘缓存格式，可选 pybase64 加速签名编码)
+pip install requests httpx[http2] orjson ijson msgpack pybase64
 """
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, Mapping, Tuple
 import requests
-import base64
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import functools
 import hmac
-import hashlib
-import uuid
+import importlib
+import os
+import time
+from urllib.parse import quote
+
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        """紧凑 JSON 序列化，直接返回 UTF-8 bytes"""
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:  # 未安装 orjson 时回退到标准库
+    import json
+
+    def _json_dumps(obj) -> bytes:
+        """紧凑 JSON 序列化，直接返回 UTF-8 bytes"""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    _json_loads = json.loads
+
+try:  # 优先使用 SIMD 加速的 pybase64
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
+_optional_modules: Dict[str, object] = {}
+
+
+def _optional_import(name: str):
+    """
+    延迟导入可选依赖 (httpx, h2, ijson, msgpack)，未安装时返回 None
+    结果 (包括未安装) 会被缓存，避免每次调用都重新搜索 sys.path
+    """
+    try:
+        return _optional_modules[name]
+    except KeyError:
+        try:
+            mod = importlib.import_module(name)
+        except ImportError:
+            mod = None
+        _optional_modules[name] = mod
+        return mod
+
+
+@functools.lru_cache(maxsize=None)
+def _disk_codec() -> Tuple[str, object, object]:
+    """
+    磁盘缓存格式 (扩展名, dumps, loads)：优先 msgpack，未安装时使用 JSON
+    扩展名带 .coinone-cache 前缀，clear_cache() 只会删除本 SDK 写入的文件
+    """
+    msgpack = _optional_import("msgpack")
+    if msgpack is not None:
+        return (".coinone-cache.msgpack",
+                lambda obj: msgpack.packb(obj, use_bin_type=True),
+                lambda data: msgpack.unpackb(data, raw=False))
+    return ".coinone-cache.json", _json_dumps, _json_loads
+
+
+def _uuid4_str() -> str:
+    """生成带短横线的 UUID v4 字符串，跳过 uuid.UUID 对象构造与整数格式化"""
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 class CoinoneAPIError(Exception):
@@ -26,78 +93,450 @@ class CoinoneRateLimitError(CoinoneAPIError):
     pass
 
 
+class _TickerStream:
+    """
+    get_tickers_iter 的增量解析器：feed() 推入响应字节块，产出已解析出的 ticker
+    同时探测顶层 result 字段；为 error 时保留整个 (很小的) 错误响应，close() 时按 _raise_if_error 抛出
+    与 get_tickers 一致：空响应不产出任何 ticker，无效 JSON 抛出 CoinoneAPIError
+    """
+
+    def __init__(self, ijson, filter_targets, raise_if_error, http_status: int):
+        self._json_error = ijson.JSONError
+        self._targets = {t.upper() for t in filter_targets} if filter_targets else None
+        self._items = ijson.sendable_list()
+        self._coro = ijson.items_coro(self._items, "tickers.item", use_float=True)
+        self._events = ijson.sendable_list()
+        self._probe = ijson.parse_coro(self._events)  # result 确定前的探测协程
+        self._chunks = []  # result 确定前 (或为 error 时) 保留原始字节
+        self._error = False
+        self._empty = True
+        self._raise_if_error = raise_if_error
+        self._http_status = http_status
+
+    def _invalid_json(self) -> CoinoneAPIError:
+        return CoinoneAPIError("API 返回了无效的 JSON", http_status=self._http_status)
+
+    def _drain(self):
+        targets = self._targets
+        for item in self._items:
+            if targets is None or str(item.get("target_currency", "")).upper() in targets:
+                yield item
+        del self._items[:]
+
+    def feed(self, chunk: bytes):
+        if not chunk:
+            return
+        self._empty = False
+        try:
+            if self._probe is not None:
+                self._chunks.append(chunk)
+                self._probe.send(chunk)
+                for prefix, _, value in self._events:
+                    if prefix == "result":
+                        self._error = value == "error"
+                        self._probe = None
+                        break
+                    if prefix.startswith("tickers"):  # result 不在 tickers 之前，不再探测
+                        self._probe = None
+                        break
+                del self._events[:]
+                if self._probe is None and not self._error:
+                    self._chunks = None
+            elif self._error:
+                self._chunks.append(chunk)
+
+            self._coro.send(chunk)
+        except self._json_error:
+            raise self._invalid_json()
+        yield from self._drain()
+
+    def close(self):
+        if self._empty:
+            return
+        if self._error:
+            try:
+                j = _json_loads(b"".join(self._chunks))
+            except ValueError:
+                raise self._invalid_json()
+            self._raise_if_error(j, self._http_status)
+            raise CoinoneAPIError("API 错误", http_status=self._http_status)
+        try:
+            self._coro.close()
+        except self._json_error:
+            raise self._invalid_json()
+        yield from self._drain()
+
+
 class CoinoneClient:
     PUBLIC_BASE_URL = "https://api.coinone.co.kr/public/v2"
     PRIVATE_BASE_URL = "https://api.coinone.co.kr"
+    # 变化较慢的公共接口的缓存秒数，按路径模板配置；未列出的接口不缓存
+    GET_CACHE_TTL = {
+        "/markets/{}": 300,
+        "/market/{}/{}": 300,
+        "/range_units/{}/{}": 3600,
+        "/ticker_new/{}": 1,
+    }
+    GET_CACHE_MAXSIZE = 256
+    # 交易所元数据 (约按月变化) 的磁盘缓存秒数，仅在传入 cache_dir 时启用
+    DISK_CACHE_TTL = {
+        "/markets/{}": 86400,
+        "/range_units/{}/{}": 86400,
+    }
 
     def __init__(self,
                  access_token: Optional[str] = None,
                  secret_key: Optional[str] = None,
                  session: Optional[requests.Session] = None,
-                 timeout: int = 10):
+                 timeout: int = 10,
+                 use_httpx: bool = True,
+                 cache_dir: Optional[str] = None):
         """
         初始化 Coinone 客户端
         - access_token, secret_key 如果不传，仅能访问 Public API
-        - session 可选，复用 HTTP 连接
+        - session 可选，复用 HTTP 连接；传入时始终使用该 requests.Session
+        - use_httpx 未传入 session 且已安装 httpx 时，使用 httpx.Client 作为传输层
+          (跟随重定向，仅对连接失败重试 2 次，不按 502/503/504 状态码重试)，此时 self.session 为 None；
+          否则创建带连接池和 GET 重试的 requests.Session，可通过 self.session 访问
+          依赖 client.session 的旧代码请传入 session 或 use_httpx=False
+        - 客户端自建的连接池需通过 close() 或 with 语句释放；传入的 session 由调用方自行关闭
+        - cache_dir 可选，市场列表/交易区间单位等元数据在该目录下做磁盘缓存，重启后免去网络请求
         """
+        self._init_state(access_token, secret_key, timeout, cache_dir)
+        httpx = _optional_import("httpx") if session is None and use_httpx else None
+        self._is_httpx = httpx is not None
+        self._owns_transport = session is None
+        # 仅调用方传入的 session 需要逐请求附带 Accept 头，自建的传输层已设为默认头
+        self._get_headers = None
+        if self._is_httpx:
+            self._http_errors = (httpx.HTTPStatusError,)
+            self.session = None
+            self._transport = httpx.Client(
+                transport=httpx.HTTPTransport(
+                    http2=_optional_import("h2") is not None,
+                    limits=httpx.Limits(max_connections=64),
+                    retries=2,
+                ),
+                timeout=timeout,
+                headers={"Accept": "application/json"},
+                follow_redirects=True,  # 与 requests 行为一致
+            )
+        else:
+            self._http_errors = (requests.HTTPError,)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=32,
+                    pool_maxsize=64,
+                    # raise_on_status=False：重试耗尽后返回最后的响应，由 _handle_public_response 转为 CoinoneAPIError
+                    # respect_retry_after_header=False：忽略 Retry-After，避免轮询线程被长时间阻塞
+                    max_retries=Retry(total=2, backoff_factor=0.1,
+                                      status_forcelist=(502, 503, 504),
+                                      allowed_methods=frozenset(["GET"]),
+                                      raise_on_status=False,
+                                      respect_retry_after_header=False),
+                )
+                session.mount("https://", adapter)
+                session.headers.update({"Accept": "application/json"})
+            else:
+                # 不修改调用方的 session
+                self._get_headers = {"Accept": "application/json"}
+            self.session = session
+            self._transport = session
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        """关闭客户端自建的 HTTP 连接池；传入的 session 不会被关闭"""
+        if self._owns_transport:
+            self._transport.close()
+
+    @property
+    def access_token(self) -> Optional[str]:
+        return self._access_token
+
+    @access_token.setter
+    def access_token(self, value: Optional[str]) -> None:
+        """修改 access_token 时同步重建预序列化的 ,"access_token":"..." 片段 (签名时拼接到 JSON 末尾)"""
+        self._access_token = value
+        self._at_fragment = b',"access_token":' + _json_dumps(value) if value else None
+
+    @property
+    def secret_key(self) -> Optional[str]:
+        return self._secret_key
+
+    @secret_key.setter
+    def secret_key(self, value: Optional[str]) -> None:
+        """修改 secret_key 时同步重建缓存的 key bytes"""
+        self._secret_key = value
+        self._secret_key_bytes = value.encode("utf-8") if value else None
+
+    def _init_state(self, access_token: Optional[str], secret_key: Optional[str], timeout: int,
+                    cache_dir: Optional[str] = None) -> None:
+        """初始化与传输层无关的状态 (凭证、预计算的签名片段、URL/GET/磁盘缓存)"""
         self.access_token = access_token
         self.secret_key = secret_key
-        self.session = session or requests.Session()
         self.timeout = timeout
+        self._url_cache: Dict[Tuple, str] = {}
+        self._get_cache: Dict[Tuple, Tuple] = {}
+        self._markets_map_cache: Dict[str, Dict[str, Dict]] = {}
+        self._disk_checked = set()  # 已查过磁盘缓存的 key，磁盘仅在冷启动时读取一次
+        self.cache_dir = cache_dir
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
 
     # ================== 公共 API 方法 ==================
-    def _get(self, path: str, params: Optional[Dict] = None) -> Tuple[Dict, Dict]:
-        """GET 请求公共 API"""
-        url = f"{self.PUBLIC_BASE_URL}{path}"
-        resp = self.session.get(url, params=params, timeout=self.timeout, headers={"Accept": "application/json"})
+    def _public_url(self, endpoint: str, parts: Tuple) -> str:
+        """拼接公共 API 完整 URL，按 (endpoint, parts) 缓存"""
+        key = (endpoint, parts)
+        url = self._url_cache.get(key)
+        if url is None:
+            url = self._url_cache[key] = self.PUBLIC_BASE_URL + endpoint.format(*parts)
+        return url
+
+    @staticmethod
+    def _parse_json(resp):
+        """直接从响应 bytes 解析 JSON，跳过 resp.json() 的文本解码"""
+        try:
+            return _json_loads(resp.content)
+        except ValueError:
+            raise CoinoneAPIError("API 返回了无效的 JSON", http_status=resp.status_code)
+
+    @staticmethod
+    def _raise_if_error(j, http_status: Optional[int] = None) -> None:
+        """响应体 result 为 error 时抛出异常，error_code 4 为频率限制"""
+        if type(j) is dict:
+            jget = j.get
+            if jget("result") == "error":
+                code = jget("error_code")
+                if str(code) == "4":
+                    raise CoinoneRateLimitError(jget("error_msg", "请求频率过高"), code=code, http_status=http_status)
+                raise CoinoneAPIError(jget("error_msg", "API 错误"), code=code, http_status=http_status)
+
+    def _handle_public_response(self, resp) -> Tuple[Dict, Mapping]:
+        """检查公共 API 响应状态并解析 JSON"""
         try:
             resp.raise_for_status()
-        except requests.HTTPError as e:
+        except self._http_errors as e:
             raise CoinoneAPIError(f"HTTP 错误: {e}", http_status=resp.status_code)
 
+        if resp.status_code == 204 or not resp.content:
+            return {}, resp.headers
+        j = self._parse_json(resp)
+        self._raise_if_error(j, resp.status_code)
+        return j, resp.headers
+
+    @staticmethod
+    def _is_success(j) -> bool:
+        """仅缓存 result 为 success 的完整响应，空响应 (204/空 body) 不进入内存或磁盘缓存"""
+        return type(j) is dict and j.get("result") == "success"
+
+    def _cache_key(self, endpoint: str, parts: Tuple, params: Optional[Dict]) -> Tuple:
+        return endpoint, parts, tuple(sorted(params.items())) if params else ()
+
+    @staticmethod
+    def _disk_cache_prefix(endpoint: str) -> str:
+        return endpoint.strip("/").split("/", 1)[0]
+
+    def _disk_cache_path(self, key: Tuple) -> Optional[str]:
+        """磁盘缓存文件路径；未启用磁盘缓存或该接口不适用时返回 None"""
+        endpoint, parts, params = key
+        if not self.cache_dir or params or endpoint not in self.DISK_CACHE_TTL:
+            return None
+        # 转义路径参数中的 / \ 等字符，保证文件始终落在 cache_dir 内
+        name = "_".join((self._disk_cache_prefix(endpoint),) + tuple(quote(str(p), safe="") for p in parts))
+        return os.path.join(self.cache_dir, name + _disk_codec()[0])
+
+    def _empty_headers(self) -> Mapping:
+        """与传输层响应头同类型 (大小写不敏感) 的空响应头，用于磁盘缓存命中"""
+        if self._is_httpx:
+            return _optional_import("httpx").Headers()
+        return requests.structures.CaseInsensitiveDict()
+
+    def _cache_lookup(self, endpoint: str, key: Tuple) -> Optional[Tuple[Dict, Mapping]]:
+        """
+        命中且未过期时返回缓存的 (data, headers)
+        磁盘缓存只在该 key 从未进入内存时 (冷启动) 读取一次，内存过期后直接走网络
+        """
+        hit = self._get_cache.get(key)
+        if hit is not None:
+            if time.monotonic() - hit[2] < self.GET_CACHE_TTL[endpoint]:
+                return hit[0], hit[1]
+            return None
+
+        if key in self._disk_checked:
+            return None
+        path = self._disk_cache_path(key)
+        if path is None:
+            return None
+        self._disk_checked.add(key)
         try:
-            j = resp.json()
-        except ValueError:
-            raise CoinoneAPIError("API 返回了无效的 JSON", http_status=resp.status_code)
+            if os.path.getmtime(path) <= time.time() - self.DISK_CACHE_TTL[endpoint]:
+                return None
+            with open(path, "rb") as f:
+                data = _disk_codec()[2](f.read())
+        except Exception:  # 文件不存在或已损坏，按未命中处理
+            return None
+        result = (data, self._empty_headers())
+        self._cache_store(key, result, persist=False)
+        return result
+
+    def _cache_store(self, key: Tuple, result: Tuple[Dict, Mapping], persist: bool = True) -> None:
+        cache = self._get_cache
+        if key not in cache and len(cache) >= self.GET_CACHE_MAXSIZE:
+            # 多线程共享客户端时其他线程可能已淘汰/修改，用 pop 容忍并发
+            try:
+                cache.pop(next(iter(cache), None), None)
+            except RuntimeError:  # 迭代期间字典被其他线程修改，本次跳过淘汰
+                pass
+        cache[key] = (result[0], result[1], time.monotonic())
+
+        path = self._disk_cache_path(key) if persist else None
+        if path is None:
+            return
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(_disk_codec()[1](result[0]))
+            os.replace(tmp, path)  # 原子替换，避免其他进程读到写了一半的文件
+        except OSError:
+            pass
 
-        if isinstance(j, dict) and j.get("result") == "error":
-            raise CoinoneAPIError(j.get("error_msg", "API 错误"), code=j.get("error_code"))
+    def clear_cache(self) -> None:
+        """
+        清空公共接口的 TTL 缓存、磁盘缓存文件及 get_markets_map 的结果
+        (如收到上新/下架通知时调用，之后的请求会重新从网络获取)
+        """
+        self._get_cache.clear()
+        self._markets_map_cache.clear()
+        self._disk_checked.clear()
+        if not self.cache_dir:
+            return
+        ext = _disk_codec()[0]
+        prefixes = tuple(self._disk_cache_prefix(e) + "_" for e in self.DISK_CACHE_TTL)
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+        for name in names:
+            if name.startswith(prefixes) and name.endswith(ext):
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
 
-        return j, dict(resp.headers)
+    def _get(self, endpoint: str, *parts: str, params: Optional[Dict] = None,
+             use_cache: bool = True) -> Tuple[Dict, Mapping]:
+        """
+        GET 请求公共 API
+        endpoint 为路径模板 (如 "/orderbook/{}/{}")，parts 为填充的路径参数
+        endpoint 在 GET_CACHE_TTL 中时结果按 TTL 缓存 (返回的是共享对象，请勿修改)；
+        use_cache=False 跳过缓存读取，但新结果仍会写入内存/磁盘缓存，可用于强制刷新
+        """
+        cacheable = endpoint in self.GET_CACHE_TTL
+        if cacheable:
+            key = self._cache_key(endpoint, parts, params)
+        if use_cache and cacheable:
+            hit = self._cache_lookup(endpoint, key)
+            if hit is not None:
+                return hit
+        url = self._public_url(endpoint, parts)
+        resp = self._transport.get(url, params=params, headers=self._get_headers, timeout=self.timeout)
+        result = self._handle_public_response(resp)
+        if cacheable and self._is_success(result[0]):
+            self._cache_store(key, result)
+        return result
 
-    def get_range_units(self, quote_currency: str, target_currency: str):
+    def get_range_units(self, quote_currency: str, target_currency: str, use_cache: bool = True):
         """获取交易区间单位 GET /range_units/{quote}/{target}"""
-        return self._get(f"/range_units/{quote_currency}/{target_currency}")
+        return self._get("/range_units/{}/{}", quote_currency, target_currency, use_cache=use_cache)
 
-    def get_markets(self, quote_currency: str = "KRW"):
+    def get_markets(self, quote_currency: str = "KRW", use_cache: bool = True):
         """获取市场列表 GET /markets/{quote_currency}"""
-        return self._get(f"/markets/{quote_currency}")
+        return self._get("/markets/{}", quote_currency, use_cache=use_cache)
+
+    @staticmethod
+    def _build_markets_map(j: Dict) -> Dict[str, Dict]:
+        return {m["target_currency"]: m for m in j.get("markets", [])}
 
-    def get_market(self, quote_currency: str, target_currency: str):
+    def get_markets_map(self, quote_currency: str = "KRW") -> Dict[str, Dict]:
+        """
+        返回 {target_currency: 市场信息} 映射，按 quote_currency 缓存，重复查询为 O(1)
+        注意：结果没有过期时间，不受 GET_CACHE_TTL/DISK_CACHE_TTL 影响，会一直保留到 clear_cache()；
+        需要感知上新/下架时请在相应事件后调用 clear_cache() (同时清除内存与磁盘缓存)
+        """
+        m = self._markets_map_cache.get(quote_currency)
+        if m is None:
+            j, _ = self.get_markets(quote_currency)
+            m = self._markets_map_cache[quote_currency] = self._build_markets_map(j)
+        return m
+
+    def get_market(self, quote_currency: str, target_currency: str, use_cache: bool = True):
         """获取单个市场信息 GET /market/{quote}/{target}"""
-        return self._get(f"/market/{quote_currency}/{target_currency}")
+        return self._get("/market/{}/{}", quote_currency, target_currency, use_cache=use_cache)
 
     def get_orderbook(self, quote_currency: str, target_currency: str, size: int = 15, order_book_unit: Optional[float] = None):
         """获取盘口数据 GET /orderbook/{quote}/{target}"""
         params = {"size": size}
         if order_book_unit is not None:
             params["order_book_unit"] = order_book_unit
-        return self._get(f"/orderbook/{quote_currency}/{target_currency}", params=params)
+        return self._get("/orderbook/{}/{}", quote_currency, target_currency, params=params)
 
     def get_trades(self, quote_currency: str, target_currency: str, size: int = 200):
         """获取成交记录 GET /trades/{quote}/{target}"""
         params = {"size": size}
-        return self._get(f"/trades/{quote_currency}/{target_currency}", params=params)
+        return self._get("/trades/{}/{}", quote_currency, target_currency, params=params)
 
-    def get_tickers(self, quote_currency: str = "KRW", additional_data: bool = False):
+    def get_tickers(self, quote_currency: str = "KRW", additional_data: bool = False, use_cache: bool = True):
         """获取所有币种行情 GET /ticker_new/{quote_currency}"""
         params = {"additional_data": "true"} if additional_data else None
-        return self._get(f"/ticker_new/{quote_currency}", params=params)
+        return self._get("/ticker_new/{}", quote_currency, params=params, use_cache=use_cache)
+
+    def _ticker_stream(self, filter_targets, http_status: int) -> "_TickerStream":
+        ijson = _optional_import("ijson")
+        if ijson is None:
+            raise ImportError("get_tickers_iter 需要安装 ijson: pip install ijson")
+        return _TickerStream(ijson, filter_targets, self._raise_if_error, http_status)
+
+    def get_tickers_iter(self, quote_currency: str = "KRW", filter_targets=None,
+                         additional_data: bool = False):
+        """
+        流式获取行情 GET /ticker_new/{quote_currency}，逐个 yield ticker dict (数字为 float，与 get_tickers 一致)
+        适合 additional_data=True 等大响应只取部分币种的场景，无需整体加载到内存
+        filter_targets 不为空时仅保留 target_currency 在其中的项；响应 result 为 error 或 JSON 无效时抛出 CoinoneAPIError，
+        204/空响应不产出任何项
+        """
+        url = self._public_url("/ticker_new/{}", (quote_currency,))
+        params = {"additional_data": "true"} if additional_data else None
+        if self._is_httpx:
+            with self._transport.stream("GET", url, params=params, timeout=self.timeout) as resp:
+                try:
+                    resp.raise_for_status()
+                except self._http_errors as e:
+                    raise CoinoneAPIError(f"HTTP 错误: {e}", http_status=resp.status_code)
+                stream = self._ticker_stream(filter_targets, resp.status_code)
+                for chunk in resp.iter_bytes():
+                    yield from stream.feed(chunk)
+        else:
+            with self._transport.get(url, params=params, headers=self._get_headers,
+                                     timeout=self.timeout, stream=True) as resp:
+                try:
+                    resp.raise_for_status()
+                except self._http_errors as e:
+                    raise CoinoneAPIError(f"HTTP 错误: {e}", http_status=resp.status_code)
+                stream = self._ticker_stream(filter_targets, resp.status_code)
+                for chunk in resp.iter_content(chunk_size=65536):
+                    yield from stream.feed(chunk)
+        yield from stream.close()
 
     def get_ticker(self, quote_currency: str, target_currency: str, additional_data: bool = False):
         """获取单个币种行情 GET /ticker_new/{quote}/{target}"""
         params = {"additional_data": "true"} if additional_data else None
-        return self._get(f"/ticker_new/{quote_currency}/{target_currency}", params=params)
+        return self._get("/ticker_new/{}/{}", quote_currency, target_currency, params=params)
 
     def get_chart(self, quote_currency: str, target_currency: str, interval: str, timestamp: Optional[int] = None, size: Optional[int] = None):
         """
@@ -109,59 +548,70 @@ class CoinoneClient:
             params["timestamp"] = timestamp
         if size is not None:
             params["size"] = size
-        return self._get(f"/chart/{quote_currency}/{target_currency}", params=params)
+        return self._get("/chart/{}/{}", quote_currency, target_currency, params=params)
 
     # ================== 私有 API 方法 ==================
-    def _encode_payload_v21(self, params: Dict) -> bytes:
+    def _encode_payload_v21(self, body: Dict) -> bytes:
         """
         V2.1 签名：nonce 使用 UUID v4，添加 access_token，然后 JSON 压缩 -> base64
+        access_token 使用 __init__ 中预序列化的片段拼接到 JSON 末尾，不经过 dict -> JSON
+        注意：直接在 body 上写入 nonce，调用方需传入新建的 dict 且之后不再复用
         """
-        body = dict(params)
-        body["access_token"] = self.access_token
-        body["nonce"] = str(uuid.uuid4())
-        json_str = json.dumps(body, separators=(",", ":"), ensure_ascii=False)
-        encoded = base64.b64encode(json_str.encode("utf-8"))
-        return encoded
+        body["nonce"] = _uuid4_str()
+        raw = _json_dumps(body)
+        if self._at_fragment is not None:
+            raw = raw[:-1] + self._at_fragment + b"}"
+        return b64encode(raw)
 
     def _sign(self, encoded_payload: bytes) -> str:
         """使用 HMAC-SHA512 签名"""
-        return hmac.new(self.secret_key.encode("utf-8"), encoded_payload, hashlib.sha512).hexdigest()
+        return hmac.digest(self._secret_key_bytes, encoded_payload, "sha512").hex()
+
+    def _sign_payload(self, body: Dict) -> Tuple[bytes, str]:
+        """编码并签名，返回 (base64 payload, hex 签名)；body 会被原地修改"""
+        encoded = self._encode_payload_v21(body)
+        return encoded, self._sign(encoded)
 
-    def _post_v21(self, path: str, params: Dict) -> Tuple[Dict, Dict]:
-        """POST 请求私有 API (V2.1)"""
+    def _build_private_request(self, path: str, body: Dict) -> Tuple[str, bytes, Dict]:
+        """生成私有 API 请求的 URL、签名后的 payload 和请求头；body 所有权转移给本方法"""
         if not self.access_token or not self.secret_key:
             raise CoinoneAPIError("调用私有 API 需要提供 access_token 和 secret_key")
 
         url = f"{self.PRIVATE_BASE_URL}{path}"
-        encoded = self._encode_payload_v21(params)
-        signature = self._sign(encoded)
+        encoded, signature = self._sign_payload(body)
+        # base64 结果为纯 ASCII，requests/httpx 均接受 bytes 请求头，无需再 decode
         headers = {
             "Content-type": "application/json",
-            "X-COINONE-PAYLOAD": encoded.decode("utf-8"),
+            "X-COINONE-PAYLOAD": encoded,
             "X-COINONE-SIGNATURE": signature
         }
-        resp = self.session.post(url, data=encoded, headers=headers, timeout=self.timeout)
+        return url, encoded, headers
 
+    def _handle_private_response(self, resp) -> Tuple[Dict, Mapping]:
+        """检查私有 API 响应状态并解析 JSON"""
         try:
             resp.raise_for_status()
-        except requests.HTTPError:
+        except self._http_errors:
             try:
-                j = resp.json()
+                j = _json_loads(resp.content)
                 raise CoinoneAPIError(j.get("error_msg", "HTTP 错误"), code=j.get("error_code"), http_status=resp.status_code)
             except ValueError:
                 raise CoinoneAPIError("HTTP 错误", http_status=resp.status_code)
 
-        try:
-            j = resp.json()
-        except ValueError:
-            raise CoinoneAPIError("API 返回了无效的 JSON", http_status=resp.status_code)
-
-        if isinstance(j, dict) and j.get("result") == "error":
-            if str(j.get("error_code")) == "4":
-                raise CoinoneRateLimitError(j.get("error_msg", "请求频率过高"), code=j.get("error_code"))
-            raise CoinoneAPIError(j.get("error_msg", "API 错误"), code=j.get("error_code"))
+        if resp.status_code == 204 or not resp.content:
+            return {}, resp.headers
+        j = self._parse_json(resp)
+        self._raise_if_error(j, resp.status_code)
+        return j, resp.headers
 
-        return j, dict(resp.headers)
+    def _post_v21(self, path: str, body: Dict) -> Tuple[Dict, Mapping]:
+        """POST 请求私有 API (V2.1)，body 会被原地加入签名字段"""
+        url, encoded, headers = self._build_private_request(path, body)
+        if self._is_httpx:
+            resp = self._transport.post(url, content=encoded, headers=headers, timeout=self.timeout)
+        else:
+            resp = self._transport.post(url, data=encoded, headers=headers, timeout=self.timeout)
+        return self._handle_private_response(resp)
 
     def place_order(self, quote_currency: str, target_currency: str, side: str, type_: str,
                     price: Optional[str] = None, qty: Optional[str] = None, amount: Optional[str] = None,
@@ -172,26 +622,17 @@ class CoinoneClient:
         side: "BUY" 或 "SELL"
         type_: "LIMIT", "MARKET", "STOP_LIMIT"
         """
+        fields = (("price", price), ("qty", qty), ("amount", amount),
+                  ("post_only", None if post_only is None else bool(post_only)),
+                  ("limit_price", limit_price), ("trigger_price", trigger_price),
+                  ("user_order_id", user_order_id))
         payload = {
             "quote_currency": quote_currency,
             "target_currency": target_currency,
             "side": side,
-            "type": type_
+            "type": type_,
+            **{k: v for k, v in fields if v is not None}
         }
-        if price is not None:
-            payload["price"] = price
-        if qty is not None:
-            payload["qty"] = qty
-        if amount is not None:
-            payload["amount"] = amount
-        if post_only is not None:
-            payload["post_only"] = bool(post_only)
-        if limit_price is not None:
-            payload["limit_price"] = limit_price
-        if trigger_price is not None:
-            payload["trigger_price"] = trigger_price
-        if user_order_id is not None:
-            payload["user_order_id"] = user_order_id
         return self._post_v21("/v2.1/order", payload)
         
     def get_balance_all(self):
@@ -204,3 +645,117 @@ class CoinoneClient:
             "quote_currency": quote_currency,
             "target_currency": target_currency
         })
+
+
+class CoinoneAsyncClient(CoinoneClient):
+    """
+    Coinone 异步客户端 (基于 httpx.AsyncClient)
+    接口与 CoinoneClient 相同，但所有 API 方法返回协程，可用 asyncio.gather 并发请求:
+
+        async def main():
+            async with CoinoneAsyncClient() as c:
+                ticker, orderbook = await asyncio.gather(
+                    c.get_ticker("KRW", "BTC"), c.get_orderbook("KRW", "BTC"))
+
+        asyncio.run(main())
+    """
+
+    def __init__(self,
+                 access_token: Optional[str] = None,
+                 secret_key: Optional[str] = None,
+                 client: Optional["httpx.AsyncClient"] = None,
+                 timeout: int = 10,
+                 cache_dir: Optional[str] = None):
+        """
+        初始化 Coinone 异步客户端
+        - access_token, secret_key 如果不传，仅能访问 Public API
+        - client 可选，复用 httpx.AsyncClient (由调用方自行关闭)；
+          未传入时自建的 AsyncClient 跟随重定向，仅对连接失败重试 2 次，需通过 aclose() 或 async with 释放
+        - cache_dir 可选，同 CoinoneClient
+        """
+        httpx = _optional_import("httpx")
+        if httpx is None:
+            raise ImportError("CoinoneAsyncClient 需要安装 httpx: pip install httpx[http2]")
+        self._init_state(access_token, secret_key, timeout, cache_dir)
+        self._is_httpx = True
+        self._http_errors = (httpx.HTTPStatusError,)
+        self.session = None
+        self._owns_transport = client is None
+        self._transport = client or httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                http2=_optional_import("h2") is not None,
+                limits=httpx.Limits(max_connections=64),
+                retries=2,
+            ),
+            timeout=timeout,
+            headers={"Accept": "application/json"},
+            follow_redirects=True,
+        )
+
+    def __enter__(self):
+        raise TypeError("CoinoneAsyncClient 请使用 async with")
+
+    def __exit__(self, *exc):
+        pass
+
+    def close(self) -> None:
+        raise TypeError("CoinoneAsyncClient 请使用 await aclose() 关闭")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def aclose(self):
+        """关闭自建的 httpx.AsyncClient；传入的 client 不会被关闭"""
+        if self._owns_transport:
+            await self._transport.aclose()
+
+    async def _get(self, endpoint: str, *parts: str, params: Optional[Dict] = None,
+                   use_cache: bool = True) -> Tuple[Dict, Mapping]:
+        """GET 请求公共 API (异步)，缓存规则同 CoinoneClient._get"""
+        cacheable = endpoint in self.GET_CACHE_TTL
+        if cacheable:
+            key = self._cache_key(endpoint, parts, params)
+        if use_cache and cacheable:
+            hit = self._cache_lookup(endpoint, key)
+            if hit is not None:
+                return hit
+        url = self._public_url(endpoint, parts)
+        resp = await self._transport.get(url, params=params, timeout=self.timeout)
+        result = self._handle_public_response(resp)
+        if cacheable and self._is_success(result[0]):
+            self._cache_store(key, result)
+        return result
+
+    async def get_markets_map(self, quote_currency: str = "KRW") -> Dict[str, Dict]:
+        """返回 {target_currency: 市场信息} 映射 (异步)，缓存规则同 CoinoneClient.get_markets_map"""
+        m = self._markets_map_cache.get(quote_currency)
+        if m is None:
+            j, _ = await self.get_markets(quote_currency)
+            m = self._markets_map_cache[quote_currency] = self._build_markets_map(j)
+        return m
+
+    async def get_tickers_iter(self, quote_currency: str = "KRW", filter_targets=None,
+                               additional_data: bool = False):
+        """流式获取行情 (异步生成器)，用法: async for t in c.get_tickers_iter(...)"""
+        url = self._public_url("/ticker_new/{}", (quote_currency,))
+        params = {"additional_data": "true"} if additional_data else None
+        async with self._transport.stream("GET", url, params=params, timeout=self.timeout) as resp:
+            try:
+                resp.raise_for_status()
+            except self._http_errors as e:
+                raise CoinoneAPIError(f"HTTP 错误: {e}", http_status=resp.status_code)
+            stream = self._ticker_stream(filter_targets, resp.status_code)
+            async for chunk in resp.aiter_bytes():
+                for item in stream.feed(chunk):
+                    yield item
+        for item in stream.close():
+            yield item
+
+    async def _post_v21(self, path: str, body: Dict) -> Tuple[Dict, Mapping]:
+        """POST 请求私有 API (V2.1，异步)，body 会被原地加入签名字段"""
+        url, encoded, headers = self._build_private_request(path, body)
+        resp = await self._transport.post(url, content=encoded, headers=headers, timeout=self.timeout)
+        return self._handle_private_response(resp)
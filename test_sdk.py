@@ -0,0 +1,463 @@
+import asyncio
+import base64
+import hmac
+import os
+
+import pytest
+import requests
+
+import sdk
+from sdk import CoinoneAPIError, CoinoneAsyncClient, CoinoneClient, CoinoneRateLimitError
+
+httpx = sdk._optional_import("httpx")
+needs_httpx = pytest.mark.skipif(httpx is None, reason="需要 httpx")
+
+
+class FakeResponse:
+    def __init__(self, body: bytes, status_code: int = 200):
+        self.content = body
+        self.status_code = status_code
+        self.headers = requests.structures.CaseInsensitiveDict({"X-Test": "1"})
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), 7):
+            yield self.content[i:i + 7]
+
+
+class FakeSession:
+    """按 URL 返回预设响应的 requests.Session 替身，记录每次 GET 的 URL"""
+
+    def __init__(self, bodies=None):
+        self.bodies = bodies or {}
+        self.calls = []
+
+    def get(self, url, params=None, headers=None, timeout=None, stream=False):
+        self.calls.append(url)
+        body = self.bodies.get(url.rsplit("/public/v2", 1)[1], b'{"result":"success"}')
+        if callable(body):
+            body = body()
+        return FakeResponse(body)
+
+
+class MockApi:
+    """httpx.MockTransport 的处理函数：按路径返回预设 body (可为 (status, body))，记录每个请求"""
+
+    def __init__(self, bodies=None):
+        self.bodies = bodies or {}
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        path = request.url.path
+        if path.startswith("/public/v2"):
+            path = path[len("/public/v2"):]
+        body = self.bodies.get(path, b'{"result":"success"}')
+        status, body = body if isinstance(body, tuple) else (200, body)
+        return httpx.Response(status, content=body, headers={"X-Test": "1"})
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = Clock()
+    monkeypatch.setattr(sdk.time, "monotonic", c)
+    return c
+
+
+def markets_body(*targets):
+    return sdk._json_dumps({"result": "success",
+                            "markets": [{"target_currency": t} for t in targets]})
+
+
+def counter_body(prefix):
+    n = [0]
+
+    def body():
+        n[0] += 1
+        return markets_body(f"{prefix}{n[0]}")
+    return body
+
+
+def test_public_url_is_cached_per_template_and_parts():
+    c = CoinoneClient(session=FakeSession())
+    c.get_orderbook("KRW", "BTC")
+    c.get_orderbook("KRW", "BTC")
+    c.get_orderbook("KRW", "ETH")
+    assert c.session.calls == [
+        "https://api.coinone.co.kr/public/v2/orderbook/KRW/BTC",
+        "https://api.coinone.co.kr/public/v2/orderbook/KRW/BTC",
+        "https://api.coinone.co.kr/public/v2/orderbook/KRW/ETH",
+    ]
+    assert len(c._url_cache) == 2
+
+
+def test_ttl_cache_hit_and_expiry(clock):
+    c = CoinoneClient(session=FakeSession({"/markets/KRW": counter_body("V")}))
+    j1, headers = c.get_markets()
+    j2, _ = c.get_markets()
+    assert j1 is j2
+    assert headers.get("x-test") == "1"
+    assert len(c.session.calls) == 1
+
+    clock.now += CoinoneClient.GET_CACHE_TTL["/markets/{}"]
+    j3, _ = c.get_markets()
+    assert j3["markets"][0]["target_currency"] == "V2"
+    assert len(c.session.calls) == 2
+
+
+def test_uncached_endpoint_always_fetches():
+    c = CoinoneClient(session=FakeSession())
+    c.get_trades("KRW", "BTC")
+    c.get_trades("KRW", "BTC")
+    assert len(c.session.calls) == 2
+
+
+def test_use_cache_false_bypasses_and_refreshes(clock):
+    c = CoinoneClient(session=FakeSession({"/markets/KRW": counter_body("V")}))
+    c.get_markets()
+    fresh, _ = c.get_markets(use_cache=False)
+    assert fresh["markets"][0]["target_currency"] == "V2"
+    cached, _ = c.get_markets()
+    assert cached is fresh
+    assert len(c.session.calls) == 2
+
+
+def test_cache_evicts_oldest_entry(clock):
+    c = CoinoneClient(session=FakeSession())
+    c.GET_CACHE_MAXSIZE = 2
+    c.get_markets("KRW")
+    c.get_markets("BTC")
+    c.get_markets("USDT")
+    assert len(c._get_cache) == 2
+    c.get_markets("KRW")
+    assert len(c.session.calls) == 4
+
+
+def test_error_body_raises_rate_limit():
+    body = b'{"result":"error","error_code":"4","error_msg":"too many"}'
+    c = CoinoneClient(session=FakeSession({"/trades/KRW/BTC": body}))
+    with pytest.raises(CoinoneRateLimitError):
+        c.get_trades("KRW", "BTC")
+
+
+def test_error_body_raises_api_error_with_code():
+    body = b'{"result":"error","error_code":"12","error_msg":"bad"}'
+    c = CoinoneClient(session=FakeSession({"/trades/KRW/BTC": body}))
+    with pytest.raises(CoinoneAPIError) as exc:
+        c.get_trades("KRW", "BTC")
+    assert exc.value.code == "12"
+    assert exc.value.http_status == 200
+    assert not isinstance(exc.value, CoinoneRateLimitError)
+
+
+def test_credentials_rebuild_signing_state():
+    c = CoinoneClient("old", "k1", session=FakeSession())
+    c.access_token = "new"
+    c.secret_key = "k2"
+    encoded, signature = c._sign_payload({})
+    assert b'"access_token":"new"' in base64.b64decode(encoded)
+    assert signature == hmac.digest(b"k2", encoded, "sha512").hex()
+
+
+def test_empty_body_returns_empty_result():
+    c = CoinoneClient(session=FakeSession({"/trades/KRW/BTC": b""}))
+    j, headers = c.get_trades("KRW", "BTC")
+    assert j == {}
+    assert headers.get("X-Test") == "1"
+
+
+def test_empty_body_is_not_cached_or_persisted(tmp_path):
+    bodies = {"/markets/KRW": b""}
+    c = CoinoneClient(session=FakeSession(bodies), cache_dir=str(tmp_path))
+    assert c.get_markets()[0] == {}
+    assert os.listdir(tmp_path) == []
+    assert c._get_cache == {}
+
+    bodies["/markets/KRW"] = markets_body("BTC")
+    assert c.get_markets_map() == {"BTC": {"target_currency": "BTC"}}
+    assert len(c.session.calls) == 2
+
+
+def test_disk_cache_read_on_cold_start(tmp_path, clock):
+    bodies = {"/markets/KRW": counter_body("V")}
+    CoinoneClient(session=FakeSession(bodies), cache_dir=str(tmp_path)).get_markets()
+
+    c = CoinoneClient(session=FakeSession(bodies), cache_dir=str(tmp_path))
+    j, headers = c.get_markets()
+    assert j["markets"][0]["target_currency"] == "V1"
+    assert c.session.calls == []
+    assert headers.get("anything") is None
+    assert isinstance(headers, requests.structures.CaseInsensitiveDict)
+
+    # 内存过期后直接走网络，不再回落到仍在 24h 内的磁盘文件
+    clock.now += CoinoneClient.GET_CACHE_TTL["/markets/{}"]
+    j, _ = c.get_markets()
+    assert j["markets"][0]["target_currency"] == "V2"
+    assert len(c.session.calls) == 1
+
+
+def test_disk_cache_ignores_expired_file(tmp_path):
+    bodies = {"/markets/KRW": counter_body("V")}
+    CoinoneClient(session=FakeSession(bodies), cache_dir=str(tmp_path)).get_markets()
+    (path,) = tmp_path.iterdir()
+    old = os.path.getmtime(path) - CoinoneClient.DISK_CACHE_TTL["/markets/{}"] - 1
+    os.utime(path, (old, old))
+
+    c = CoinoneClient(session=FakeSession(bodies), cache_dir=str(tmp_path))
+    j, _ = c.get_markets()
+    assert j["markets"][0]["target_currency"] == "V2"
+
+
+def test_use_cache_false_writes_through_to_disk(tmp_path):
+    bodies = {"/markets/KRW": counter_body("V")}
+    c = CoinoneClient(session=FakeSession(bodies), cache_dir=str(tmp_path))
+    c.get_markets()
+    c.get_markets(use_cache=False)
+
+    c2 = CoinoneClient(session=FakeSession(bodies), cache_dir=str(tmp_path))
+    j, _ = c2.get_markets()
+    assert j["markets"][0]["target_currency"] == "V2"
+    assert c2.session.calls == []
+
+
+def test_clear_cache_only_removes_own_files(tmp_path):
+    (tmp_path / "markets_report.json").write_text("{}")
+    c = CoinoneClient(session=FakeSession(), cache_dir=str(tmp_path))
+    c.get_markets()
+    c.get_range_units("KRW", "BTC")
+    assert len(os.listdir(tmp_path)) == 3
+
+    c.clear_cache()
+    assert os.listdir(tmp_path) == ["markets_report.json"]
+
+
+def test_disk_cache_path_stays_inside_cache_dir(tmp_path):
+    cache_dir = tmp_path / "cache"
+    c = CoinoneClient(session=FakeSession(), cache_dir=str(cache_dir))
+    c.get_range_units("../..", "a/b\\c")
+    assert list(tmp_path.iterdir()) == [cache_dir]
+    (name,) = os.listdir(cache_dir)
+    assert "/" not in name and "\\" not in name
+
+
+def test_markets_map_cached_until_clear_cache(tmp_path):
+    bodies = {"/markets/KRW": counter_body("V")}
+    CoinoneClient(session=FakeSession(bodies), cache_dir=str(tmp_path)).get_markets()
+
+    c = CoinoneClient(session=FakeSession(bodies), cache_dir=str(tmp_path))
+    m = c.get_markets_map()
+    assert list(m) == ["V1"]
+    assert c.get_markets_map() is m
+
+    c.clear_cache()
+    assert list(tmp_path.iterdir()) == []
+    assert list(c.get_markets_map()) == ["V2"]
+
+
+class TestTickersIter:
+    @pytest.fixture(autouse=True)
+    def _ijson(self):
+        pytest.importorskip("ijson")
+
+    def test_filters_and_yields_floats(self):
+        body = (b'{"result":"success","tickers":['
+                b'{"target_currency":"BTC","last":1.5},{"target_currency":"ETH","last":2.25}]}')
+        c = CoinoneClient(session=FakeSession({"/ticker_new/KRW": body}))
+        assert list(c.get_tickers_iter(filter_targets=["eth"])) == [
+            {"target_currency": "ETH", "last": 2.25}]
+        (btc, _) = c.get_tickers_iter()
+        assert type(btc["last"]) is float
+
+    def test_error_body_raises(self):
+        body = b'{"result":"error","error_code":"4","error_msg":"too many"}'
+        c = CoinoneClient(session=FakeSession({"/ticker_new/KRW": body}))
+        with pytest.raises(CoinoneRateLimitError):
+            list(c.get_tickers_iter())
+
+        body = b'{"result":"error","error_code":"12","error_msg":"bad"}'
+        c = CoinoneClient(session=FakeSession({"/ticker_new/KRW": body}))
+        with pytest.raises(CoinoneAPIError) as exc:
+            list(c.get_tickers_iter())
+        assert exc.value.code == "12"
+
+    def test_empty_body_yields_nothing(self):
+        c = CoinoneClient(session=FakeSession({"/ticker_new/KRW": b""}))
+        assert list(c.get_tickers_iter()) == []
+
+    @pytest.mark.parametrize("body", [
+        b'{"result":"success","tickers":[{"target_currency":"BTC"',
+        b"<html>502</html>",
+        b'{"result":"err',
+    ])
+    def test_invalid_json_raises_api_error(self, body):
+        c = CoinoneClient(session=FakeSession({"/ticker_new/KRW": body}))
+        with pytest.raises(CoinoneAPIError) as exc:
+            list(c.get_tickers_iter())
+        assert exc.value.http_status == 200
+
+
+def test_default_requests_session_retry_policy():
+    c = CoinoneClient(use_httpx=False)
+    retry = c.session.get_adapter("https://api.coinone.co.kr").max_retries
+    assert retry.total == 2
+    assert retry.raise_on_status is False
+    assert retry.respect_retry_after_header is False
+    assert c.session.headers["Accept"] == "application/json"
+    c.close()
+
+
+def test_caller_session_is_not_modified():
+    session = requests.Session()
+    before = dict(session.headers)
+    CoinoneClient(session=session)
+    assert dict(session.headers) == before
+
+
+@needs_httpx
+class TestAsyncClient:
+    def client(self, api, **kwargs):
+        return CoinoneAsyncClient("at", "sk", client=httpx.AsyncClient(transport=httpx.MockTransport(api)), **kwargs)
+
+    def test_gather_public_and_private(self):
+        api = MockApi({"/ticker_new/KRW/BTC": b'{"result":"success","tickers":[]}',
+                       "/v2.1/account/balance/all": b'{"result":"success","balances":[]}'})
+
+        async def run():
+            async with self.client(api) as c:
+                return await asyncio.gather(
+                    c.get_ticker("KRW", "BTC"), c.get_orderbook("KRW", "BTC"), c.get_balance_all())
+
+        ticker, orderbook, balance = asyncio.run(run())
+        assert ticker[0]["tickers"] == []
+        assert orderbook[0] == {"result": "success"}
+        assert balance[0]["balances"] == []
+        assert balance[1]["x-test"] == "1"
+
+        (post,) = [r for r in api.requests if r.method == "POST"]
+        payload = post.headers["X-COINONE-PAYLOAD"].encode()
+        assert post.content == payload
+        assert post.headers["X-COINONE-SIGNATURE"] == hmac.digest(b"sk", payload, "sha512").hex()
+        assert b'"access_token":"at"' in base64.b64decode(payload)
+
+    def test_tickers_iter(self):
+        pytest.importorskip("ijson")
+        body = (b'{"result":"success","tickers":['
+                b'{"target_currency":"BTC","last":1.5},{"target_currency":"ETH","last":2.25}]}')
+        api = MockApi({"/ticker_new/KRW": body})
+
+        async def run():
+            async with self.client(api) as c:
+                return [t async for t in c.get_tickers_iter(filter_targets=["btc"])]
+
+        assert asyncio.run(run()) == [{"target_currency": "BTC", "last": 1.5}]
+
+    def test_markets_map_cached(self):
+        api = MockApi({"/markets/KRW": markets_body("BTC", "ETH")})
+
+        async def run():
+            async with self.client(api) as c:
+                m1 = await c.get_markets_map()
+                m2 = await c.get_markets_map()
+                return m1, m2
+
+        m1, m2 = asyncio.run(run())
+        assert m1 is m2
+        assert list(m1) == ["BTC", "ETH"]
+        assert len(api.requests) == 1
+
+    def test_aclose_only_closes_owned_client(self):
+        async def run():
+            shared = httpx.AsyncClient(transport=httpx.MockTransport(MockApi()))
+            c = CoinoneAsyncClient(client=shared)
+            await c.aclose()
+            borrowed_closed = shared.is_closed
+            await shared.aclose()
+
+            owned = CoinoneAsyncClient()
+            await owned.aclose()
+            return borrowed_closed, owned._transport.is_closed
+
+        assert asyncio.run(run()) == (False, True)
+
+    def test_sync_close_points_to_aclose(self):
+        c = CoinoneAsyncClient(client=httpx.AsyncClient(transport=httpx.MockTransport(MockApi())))
+        with pytest.raises(TypeError, match="aclose"):
+            c.close()
+        with pytest.raises(TypeError, match="async with"):
+            with c:
+                pass
+
+
+@needs_httpx
+class TestHttpxTransport:
+    @pytest.fixture
+    def api(self, monkeypatch):
+        api = MockApi()
+        monkeypatch.setattr(httpx, "HTTPTransport", lambda **kwargs: httpx.MockTransport(api))
+        return api
+
+    def test_default_transport_is_httpx(self, api):
+        with CoinoneClient() as c:
+            assert c.session is None
+            assert isinstance(c._transport, httpx.Client)
+            j, headers = c.get_orderbook("KRW", "BTC")
+        assert j == {"result": "success"}
+        assert isinstance(headers, httpx.Headers)
+        assert api.requests[0].headers["Accept"] == "application/json"
+        assert api.requests[0].url.params["size"] == "15"
+        assert c._transport.is_closed
+
+    def test_private_post_sends_signed_content(self, api):
+        api.bodies["/v2.1/order/cancel/all"] = b'{"result":"success"}'
+        with CoinoneClient("at", "sk") as c:
+            c.cancel_all_orders("KRW", "BTC")
+        (post,) = api.requests
+        payload = post.headers["X-COINONE-PAYLOAD"].encode()
+        assert post.content == payload
+        assert post.headers["Content-type"] == "application/json"
+        assert post.headers["X-COINONE-SIGNATURE"] == hmac.digest(b"sk", payload, "sha512").hex()
+        assert b'"target_currency":"BTC"' in base64.b64decode(payload)
+
+    def test_http_status_errors_map_to_api_error(self, api):
+        api.bodies["/trades/KRW/BTC"] = (500, b"")
+        api.bodies["/v2.1/account/balance/all"] = (400, b'{"result":"error","error_code":"107","error_msg":"bad"}')
+        with CoinoneClient("at", "sk") as c:
+            with pytest.raises(CoinoneAPIError) as exc:
+                c.get_trades("KRW", "BTC")
+            assert exc.value.http_status == 500
+            with pytest.raises(CoinoneAPIError) as exc:
+                c.get_balance_all()
+            assert (exc.value.http_status, exc.value.code) == (400, "107")
+
+    def test_tickers_iter_streams(self, api):
+        pytest.importorskip("ijson")
+        api.bodies["/ticker_new/KRW"] = b'{"result":"success","tickers":[{"target_currency":"BTC","last":1.5}]}'
+        with CoinoneClient() as c:
+            assert list(c.get_tickers_iter()) == [{"target_currency": "BTC", "last": 1.5}]
+
+    def test_disk_hit_returns_httpx_headers(self, api, tmp_path):
+        api.bodies["/markets/KRW"] = markets_body("BTC")
+        with CoinoneClient(cache_dir=str(tmp_path)) as c:
+            c.get_markets()
+        with CoinoneClient(cache_dir=str(tmp_path)) as c:
+            j, headers = c.get_markets()
+        assert list(c._build_markets_map(j)) == ["BTC"]
+        assert isinstance(headers, httpx.Headers)
+        assert len(api.requests) == 1